@@ -1,17 +1,17 @@
 from __future__ import annotations
 import argparse
-import json
+import os
 from .logging_config import setup_logging
 from .types import ConvertRequest
-from .convert import convert
+from .convert import convert, convert_many
 from .parsers import bootstrap
 
 def main() -> int:
     bootstrap()
     p = argparse.ArgumentParser(description="Enterprise PDF→XLSX converter (multi-supplier)")
-    p.add_argument("--pdf", required=True, help="Input PDF path")
+    p.add_argument("--pdf", required=True, nargs="+", help="Input PDF path(s); several PDFs convert in parallel")
     p.add_argument("--template", required=True, help="XLSX template path")
-    p.add_argument("--out", required=True, help="Output XLSX path")
+    p.add_argument("--out", required=True, help="Output XLSX path (a directory when several PDFs are given)")
     p.add_argument("--supplier", required=True, help="Supplier key (e.g. omnia, generic)")
     p.add_argument("--options", default="{}", help="JSON options (sheet_name, mapping, clear_existing, etc.)")
     p.add_argument("--log", default="INFO", help="Log level")
@@ -19,19 +19,42 @@ def main() -> int:
 
     setup_logging(args.log)
 
+    import json
+
     options = json.loads(args.options) if args.options else {}
-    req = ConvertRequest(
-        pdf_path=args.pdf,
-        template_xlsx_path=args.template,
-        output_xlsx_path=args.out,
-        supplier_key=args.supplier,
-        options=options,
-    )
-    res = convert(req)
-    if res.warnings:
-        print("\nWARNINGS:")
-        for w in res.warnings:
-            print("-", w)
+
+    if len(args.pdf) == 1:
+        req = ConvertRequest(
+            pdf_path=args.pdf[0],
+            template_xlsx_path=args.template,
+            output_xlsx_path=args.out,
+            supplier_key=args.supplier,
+            options=options,
+        )
+        res = convert(req)
+        if res.warnings:
+            print("\nWARNINGS:")
+            for w in res.warnings:
+                print("-", w)
+        return 0
+
+    # Batch mode: --out is a directory, outputs take the PDF's base name.
+    os.makedirs(args.out, exist_ok=True)
+    reqs = [
+        ConvertRequest(
+            pdf_path=pdf,
+            template_xlsx_path=args.template,
+            output_xlsx_path=os.path.join(args.out, os.path.splitext(os.path.basename(pdf))[0] + ".xlsx"),
+            supplier_key=args.supplier,
+            options=options,
+        )
+        for pdf in args.pdf
+    ]
+    for req, res in zip(reqs, convert_many(reqs)):
+        if res.warnings:
+            print(f"\nWARNINGS ({req.pdf_path}):")
+            for w in res.warnings:
+                print("-", w)
     return 0
 
 if __name__ == "__main__":
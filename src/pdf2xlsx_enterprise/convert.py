@@ -1,7 +1,10 @@
 from __future__ import annotations
-from typing import Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List
 import logging
-from .pdf_reader import extract_text_by_page, extract_tables
+import os
+from .pdf_reader import extract_pages_cached
+from .parsers import bootstrap
 from .parsers.registry import get as get_parser
 from .xlsx_writer import write_items_to_template
 from .types import ConvertRequest, ParseResult
@@ -9,8 +12,11 @@ from .types import ConvertRequest, ParseResult
 log = logging.getLogger(__name__)
 
 def convert(req: ConvertRequest) -> ParseResult:
-    text_pages = extract_text_by_page(req.pdf_path)
-    tables = extract_tables(req.pdf_path)
+    # Text and tables come out of one open/traversal; pdfplumber re-parses
+    # the document per open, so a single pass beats two overlapped ones. The
+    # cached variant also skips the parse entirely when the same unmodified
+    # PDF is converted again in this process.
+    text_pages, tables = extract_pages_cached(req.pdf_path)
 
     parser = get_parser(req.supplier_key)
     log.info("Using parser: %s (%s)", parser.display_name, parser.supplier_key)
@@ -21,3 +27,13 @@ def convert(req: ConvertRequest) -> ParseResult:
     result = parser.parse(text_pages, tables, req.options or {})
     write_items_to_template(req.template_xlsx_path, req.output_xlsx_path, result.items, req.options or {})
     return result
+
+def convert_many(reqs: List[ConvertRequest], max_workers: int | None = None) -> List[ParseResult]:
+    # PDF extraction is CPU-bound, so batch jobs fan out across processes.
+    # bootstrap() runs as the pool initializer so each worker has a populated
+    # parser registry. Results come back in input order.
+    if len(reqs) <= 1:
+        return [convert(r) for r in reqs]
+    workers = max_workers or min(len(reqs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers, initializer=bootstrap) as ex:
+        return list(ex.map(convert, reqs))
@@ -1,8 +1,6 @@
 from __future__ import annotations
 import json
 import os
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
 
 from .logging_config import setup_logging
 from .types import ConvertRequest
@@ -19,6 +17,11 @@ def load_profiles(path: str) -> dict:
         return json.load(f)
 
 def main() -> None:
+    # Imported here so that merely importing this module (e.g. from the CLI
+    # entry-point machinery) does not pay Tk initialization cost.
+    import tkinter as tk
+    from tkinter import ttk, filedialog, messagebox
+
     setup_logging("INFO")
     bootstrap()
     suppliers = all_parsers()
@@ -1,48 +1,131 @@
 from __future__ import annotations
 
+import functools
 import re
 from typing import Dict, Any, List, Optional, Tuple
 
 from .base import SupplierParser
 from ..types import ParseResult, LineItem
-from ..utils import normalize_ws, money_to_str
+from ..utils import normalize_ws
+
+# Optional: google-re2 (linear-time DFA engine). The patterns below run on
+# every PDF line, so when pyre2 is installed we compile through it; stdlib
+# `re` stays as the fallback for environments without it (and for any
+# pattern re2 rejects).
+try:
+    import re2 as _re2  # type: ignore
+except ImportError:
+    _re2 = None
+
+
+def _compile(pattern: str, flags: int = 0) -> "re.Pattern[str]":
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern, flags)
+        except Exception:
+            pass  # re2 rejects some constructs; stdlib handles them all
+    return re.compile(pattern, flags)
 
 
 # -----------------------------
 # Helpers
 # -----------------------------
 
-_RE_HEADER = re.compile(
-    r"\bPRODUCT\s+CODE\b.*\bDESCRIPTION\b.*\bQUANTITY\b.*\bPREZZO\b.*\bIMPORTO\s+TOTALE\b",
-    re.IGNORECASE,
-)
+# Words that make up the item-table header line. Checked with plain substring
+# scans on the lowercased line (each `in` is one C-level scan) instead of a
+# multi-alternation regex; a line carrying all of them is the header.
+_HEADER_WORDS = ("product code", "description", "quantity", "prezzo", "importo totale")
+
+
+# PDF extraction leaks private-use bullet/glyph code points (and the odd
+# non-breaking space) into the text. One table pass folds them to plain
+# spaces before whitespace normalization; normalize_ws alone leaves the
+# private-use characters in place because they are not Unicode whitespace.
+_ODD_SPACES = str.maketrans({"\u00a0": " ", "\uf0be": " ", "\uf0a7": " "})
+
+
+# One finditer pass over the whole document replaces splitlines plus a
+# per-line strip: the pattern consumes leading/trailing blanks itself and
+# only yields non-empty line bodies, so blank lines never surface in Python.
+_LINE_RE = _compile(r"[^\S\n]*(\S[^\n]*?)[^\S\n]*(?:\n|$)")
+
+# Whitespace runs inside a single line (excludes the newline, which the
+# line pattern already consumed)
+_INNER_WS_RE = _compile(r"[^\S\n]+")
+
 
-# Token that looks like a product code at start of a line (very permissive)
-_RE_STARTS_WITH_CODE = re.compile(r"^(?P<code>[A-Z0-9][A-Z0-9.\-]{1,})\b")
+def _iter_clean_lines(text: str):
+    """Yield cleaned, non-empty lines of the prepared document text."""
+    text = text.translate(_ODD_SPACES)  # one pass over the whole document
+    sub = _INNER_WS_RE.sub
+    for m in _LINE_RE.finditer(text):
+        yield sub(" ", m.group(1))
 
-# Lines that are only a prefix ending with dash (e.g., "SS-" or "VEN-")
-_RE_PREFIX_ONLY = re.compile(r"^(?P<prefix>[A-Z]{2,6}-)$")
+
+# Totals-section sentinels. These lines lead with the keyword
+# (TOTALE DOCUMENTO, IMPONIBILE IVA, TOTAL ...), so a single C-level
+# startswith against the tuple decides it; "total" also covers "totale".
+_TOTALS_PREFIXES = ("total", "imponibile")
+
+
+def _is_header_line(line_lower: str) -> bool:
+    # "product code" is the rarest marker; test it first so ordinary lines
+    # are rejected after a single scan.
+    if "product code" not in line_lower:
+        return False
+    return all(w in line_lower for w in _HEADER_WORDS[1:])
+
+# Union of the two line-start shapes so a single match attempt decides both:
+#  - prefix: line that is only a prefix ending with dash (e.g., "SS-" or "VEN-")
+#  - code:   token that looks like a product code at start of a line (very permissive)
+# Prefix comes first in the alternation so "SS-" is tagged as a prefix, not a code.
+_RE_LINE_START = _compile(r"(?P<prefix>^[A-Z]{2,6}-$)|(?P<code>^[A-Z0-9][A-Z0-9.\-]{1,})\b")
 
 # End-of-line pattern for Omnia rows (qty + PZ + price + total)
 # Example:
 # 125709  LAMP COVER ... 100 PZ 1.15€ 115.00€
-_RE_ROW_TAIL = re.compile(
-    r"(?P<desc>.+?)\s+(?P<qty>\d+)\s+PZ\s+(?P<price>\d+[.,]\d{2})\s*€?\s+(?P<total>\d+[.,]\d{2})\s*€?\s*$",
+# Deliberately has no leading (?P<desc>.+?) group: the lazy dot combined
+# with the numeric tail made the engine re-expand the description on every
+# failed tail position, which blows up on long concatenated buffers. The
+# caller searches for the anchored tail and slices the description off the
+# front instead.
+_RE_ROW_TAIL = _compile(
+    r"(?P<qty>\d+)\s+PZ\s+(?P<price>\d+[.,]\d{2})\s*€?\s+(?P<total>\d+[.,]\d{2})\s*€?\s*$",
     re.IGNORECASE,
 )
 
 
+# One table-driven pass replaces the old normalize_ws + replace +
+# money_to_str chain (three scans and as many intermediate strings).
+_MONEY_TRANS = str.maketrans({",": ".", "€": None, " ": None, " ": None})
+
+
+# Both cleaners run several times per item over a tiny domain of short
+# captured strings (qty like "2", prices repeating per SKU), so cached
+# lookups replace most of the repeat work on large invoices.
+@functools.lru_cache(maxsize=8192)
 def _clean_money(s: str) -> str:
     """Return normalized money string like '1.95'."""
-    s = normalize_ws(s).replace("€", "").strip()
-    # money_to_str already normalizes comma/dot; keep using it
-    return money_to_str(s)
+    return s.translate(_MONEY_TRANS).strip()
+
+
+_DIGITS_RE = _compile(r"\d+")
+
+
+def _is_money_ok(s: str) -> bool:
+    """Accept the cleaned money shape: '115' or '115.00'."""
+    whole, sep, frac = s.partition(".")
+    return whole.isdigit() and (not sep or (len(frac) == 2 and frac.isdigit()))
 
+# The VEN- anomaly shape: 4 digits before the dot, leading '9' to drop
+_VEN_NINE_RE = _compile(r"9\d{3}\.\d{3}")
 
+
+@functools.lru_cache(maxsize=8192)
 def _clean_qty(s: str) -> str:
     s = normalize_ws(s).strip()
     # keep digits only
-    m = re.search(r"\d+", s)
+    m = _DIGITS_RE.search(s)
     return m.group(0) if m else ""
 
 
@@ -55,15 +138,64 @@ def _fix_prefix_code(prefix: str, first_token: str) -> str:
     token = first_token.strip()
 
     # Your explicit rule: for VEN- drop leading '9' if it forms 4 digits before dot (9161.167)
-    if prefix.upper() == "VEN-" and re.fullmatch(r"9\d{3}\.\d{3}", token):
+    if prefix.upper() == "VEN-" and _VEN_NINE_RE.fullmatch(token):
         token = token[1:]  # 9161.167 -> 161.167
 
     return f"{prefix}{token}"
 
 
+# A row's code prefix sometimes lands alone on its own physical line
+# ("SS-" / "VEN-") with the rest of the row on the next line. One multiline
+# pass over the whole document stitches the prefix back onto the following
+# token (applying the VEN- anomaly via the callback), so the per-line state
+# machine no longer needs pending-prefix state. Compiled with stdlib re:
+# re2 does not support callable replacements.
+_PREFIX_JOIN_RE = re.compile(r"(?m)^[ \t]*([A-Z]{2,6}-)[ \t]*(?:\n[ \t]*)+(\S+)")
+
+
+def _join_wrapped_prefixes(text: str) -> str:
+    # A wrapped prefix requires a dash somewhere in the document; one
+    # C-level scan skips the substitution entirely for documents without
+    # any. (Kept deliberately loose: gating on "-\n" would miss a dash
+    # followed by trailing blanks, which the pattern tolerates.)
+    if "-" not in text:
+        return text
+    return _PREFIX_JOIN_RE.sub(lambda m: _fix_prefix_code(m.group(1), m.group(2)), text)
+
+
+def _is_raw_money(s: str) -> bool:
+    """Accept the captured money shape: digits, one '.' or ',', two decimals."""
+    if len(s) < 4:
+        return False
+    return s[-3] in ".," and s[:-3].isdigit() and s[-2:].isdigit()
+
+
+def _parse_row_tail_fast(rest: str) -> Optional[Tuple[str, str, str, str]]:
+    """
+    Tokenize '<desc> <qty> PZ <price>€ <total>€' from the right using only
+    str methods. Returns (desc, qty, price, total) raw strings, or None when
+    the shape is off so the regex fallback can decide.
+    """
+    parts = rest.rsplit("€", 2)
+    if len(parts) != 3 or parts[2].strip():
+        return None
+    total = parts[1].strip()
+    head, sep, price = parts[0].rstrip().rpartition(" ")
+    if not sep or not _is_raw_money(price) or not _is_raw_money(total):
+        return None
+    if not head.upper().endswith(" PZ"):
+        return None
+    # rpartition with no separator leaves desc empty and the whole head as
+    # the qty candidate, which covers rows without a description.
+    desc, _, qty = head[:-3].rstrip().rpartition(" ")
+    if not qty.isdigit():
+        return None
+    return desc, qty, price, total
+
+
 def _split_first_token(line: str) -> Tuple[str, str]:
-    """Split line into first token and remainder."""
-    parts = normalize_ws(line).split(" ", 1)
+    """Split a whitespace-normalized line into first token and remainder."""
+    parts = line.split(" ", 1)
     if not parts:
         return "", ""
     if len(parts) == 1:
@@ -71,13 +203,162 @@ def _split_first_token(line: str) -> Tuple[str, str]:
     return parts[0], parts[1]
 
 
-def _looks_like_item_start(line: str) -> bool:
-    line = normalize_ws(line)
+# Line tags for the per-line dispatch in OmniaParser.parse. _classify does
+# one cheap pass of str-level checks (first char, length, trailing dash) and
+# only invokes a regex when the line could plausibly match it; the regexes
+# remain authoritative.
+_LINE_OTHER = 0
+_LINE_PREFIX = 1
+_LINE_ITEM_START = 2
+
+
+def _classify(line: str) -> int:
     if not line:
-        return False
-    if _RE_PREFIX_ONLY.match(line):
+        return _LINE_OTHER
+    c = line[0]
+    if not ("A" <= c <= "Z" or c.isdigit()):
+        return _LINE_OTHER
+    m = _RE_LINE_START.match(line)
+    if m is None:
+        return _LINE_OTHER
+    return _LINE_PREFIX if m.group("prefix") is not None else _LINE_ITEM_START
+
+
+def _looks_like_item_start(line: str) -> bool:
+    return _classify(normalize_ws(line)) != _LINE_OTHER
+
+
+# -----------------------------
+# Row assembly state machine
+# -----------------------------
+
+class _RowAssembler:
+    """
+    Accumulates wrapped physical lines into logical item rows and emits
+    LineItems. Holding the state on slotted attributes (instead of closure
+    cells rebound via nonlocal) keeps per-line access cheap in the hot loop.
+    Lines fed in are expected to be whitespace-normalized and non-empty.
+    """
+
+    __slots__ = ("items", "warnings", "buf")
+
+    def __init__(self) -> None:
+        self.items: List[LineItem] = []
+        self.warnings: List[str] = []
+        self.buf: List[str] = []
+
+    def feed(self, ln: str) -> bool:
+        """Consume one line; return False once row collection should stop."""
+        lo = ln.lower()
+
+        # Stray header repeats (page breaks) are skipped up front: the gate
+        # inside _is_header_line is one substring scan, and skipping here
+        # keeps a repeated header from ever seeding the row buffer.
+        if _is_header_line(lo):
+            return True
+
+        tag = _classify(ln)
+
+        # Stop heuristics: once the totals section starts, items are over.
+        # Stopping needs at least one collected item so a stray keyword in
+        # the preamble cannot end the parse before the table; an in-flight
+        # buffer gets its final flush attempt in finish().
+        if tag == _LINE_OTHER and lo.startswith(_TOTALS_PREFIXES) and self.items:
+            return False
+
+        # Prefix-only line like "SS-" or "VEN-": normally stitched onto its
+        # row by _join_wrapped_prefixes; a straggler has nothing to attach to.
+        if tag == _LINE_PREFIX and not self.buf:
+            return True
+
+        # The row tail is anchored at the end of the joined buffer, so a row
+        # can only complete on a line that itself carries the euro sign;
+        # skipping the flush (join + tail match) for other lines leaves the
+        # common continuation path with zero scans of the buffer.
+        completes = "€" in ln
+
+        # Start of a new item row?
+        if not self.buf and tag != _LINE_OTHER:
+            self.buf = [ln]
+            # If complete immediately, flush; else keep accumulating next
+            # lines (wrapped description)
+            if completes:
+                self._flush_if_complete()
+            return True
+
+        # If we are accumulating, add line and try to flush
+        if self.buf:
+            self.buf.append(ln)
+            if completes and self._flush_if_complete():
+                return True
+
+            # Guard: if buffer becomes too long, reset to avoid runaway
+            if len(self.buf) > 4:
+                self.warnings.append(f"Could not parse row (skipped): {' | '.join(self.buf)}")
+                self.buf = []
+
+        # Otherwise ignore line
+        return True
+
+    def finish(self) -> None:
+        """Final flush attempt for a row still sitting in the buffer."""
+        if self.buf and not self._flush_if_complete():
+            self.warnings.append(f"Incomplete row at end (skipped): {' | '.join(self.buf)}")
+
+    def _flush_if_complete(self) -> bool:
+        buf = self.buf
+        if not buf:
+            return False
+
+        # Parts are normalized and non-empty, so the plain join is already
+        # whitespace-normalized; no need to re-scan the growing candidate.
+        candidate = " ".join(buf)
+
+        # Cheap gate: a complete row always carries the PZ unit marker and a
+        # euro sign. Two C-level substring scans reject the common
+        # "description still wrapping" buffer before the tail regex (the most
+        # expensive pattern here) gets to backtrack over it.
+        if "€" not in candidate or " PZ " not in candidate.upper():
+            return False
+
+        # candidate should start with code token
+        code_token, rest = _split_first_token(candidate)
+        if not code_token:
+            self.buf = []
+            return False
+
+        # Tail (qty/price/total) must match; everything before it is the
+        # description, which may be empty (some rows carry only a code).
+        # The str tokenizer covers the regular '... qty PZ price€ total€'
+        # shape; the regex stays as fallback for laxer spacing or a missing
+        # euro sign.
+        fast = _parse_row_tail_fast(rest)
+        if fast is not None:
+            desc, qty_raw, price_raw, total_raw = fast
+        else:
+            m = _RE_ROW_TAIL.search(rest)
+            if not m:
+                return False
+            desc = rest[: m.start()].strip()
+            # groups() pulls all three captures in one C call; the names in
+            # the pattern stay for readability.
+            qty_raw, price_raw, total_raw = m.groups()
+        qty = _clean_qty(qty_raw)
+        price = _clean_money(price_raw)
+        total = _clean_money(total_raw)
+
+        # extra safety: if price/total not numeric-like after cleanup, drop
+        if not _is_money_ok(price):
+            price = ""
+        if not _is_money_ok(total):
+            total = ""
+
+        # positional, in LineItem field order:
+        # (product_number, product_name, customs_code, weight_g,
+        #  delivered_qty, net_unit_price, total_price)
+        self.items.append(LineItem(code_token, desc, "", "", qty, price, total))
+        self.buf = []
         return True
-    return bool(_RE_STARTS_WITH_CODE.match(line))
 
 
 # -----------------------------
@@ -105,140 +386,51 @@ class OmniaParser(SupplierParser):
     display_name = "Omnia (enterprise invoice layout)"
 
     def can_parse(self, pdf_text_pages: List[str], tables: list) -> bool:
-        text = "\n".join(pdf_text_pages).lower()
-        # robust signatures seen in your PDFs
-        return ("omniacomponents" in text) or ("26vin" in text) or ("product code" in text and "importo totale" in text)
+        # Robust signatures seen in your PDFs. Scan page by page so a match
+        # on page 1 skips lowercasing the rest of the document (and no joined
+        # copy of the whole text is allocated at all).
+        seen_code = seen_totale = False
+        for page in pdf_text_pages:
+            low = (page or "").lower()
+            if "omniacomponents" in low or "26vin" in low:
+                return True
+            seen_code = seen_code or "product code" in low
+            seen_totale = seen_totale or "importo totale" in low
+            if seen_code and seen_totale:
+                return True
+        return False
 
     def parse(self, pdf_text_pages: List[str], tables: list, options: Dict[str, Any]) -> ParseResult:
         warnings: List[str] = []
         items: List[LineItem] = []
 
         # We intentionally prefer text parsing for this supplier (tables from PDF are often messy).
-        raw_lines: List[str] = []
-        for page in pdf_text_pages:
-            for ln in (page or "").splitlines():
-                ln = normalize_ws(ln)
-                if ln:
-                    raw_lines.append(ln)
-
-        # 1) Find the item table start by header line
-        start_idx = 0
-        for i, ln in enumerate(raw_lines):
-            if _RE_HEADER.search(ln):
-                start_idx = i + 1
-                break
-
-        lines = raw_lines[start_idx:]
-
-        # 2) Walk lines and assemble logical rows
-        pending_prefix: Optional[str] = None
-        buf: List[str] = []
-
-        def flush_buf_if_complete() -> bool:
-            nonlocal buf, pending_prefix, items
-            if not buf:
-                return False
-
-            candidate = normalize_ws(" ".join(buf))
-            # candidate should start with code token
-            code_token, rest = _split_first_token(candidate)
-            if not code_token:
-                buf = []
-                return False
-
-            # Tail (qty/price/total) must match
-            m = _RE_ROW_TAIL.match(rest)
-            if not m:
-                return False
-
-            desc = normalize_ws(m.group("desc")).strip()
-            qty = _clean_qty(m.group("qty"))
-            price = _clean_money(m.group("price"))
-            total = _clean_money(m.group("total"))
-
-            # extra safety: if price/total not numeric-like after cleanup, drop
-            if not re.fullmatch(r"\d+(?:\.\d{2})?", price):
-                price = ""
-            if not re.fullmatch(r"\d+(?:\.\d{2})?", total):
-                total = ""
-
-            items.append(
-                LineItem(
-                    product_number=code_token,
-                    product_name=desc,
-                    customs_code="",
-                    weight_g="",
-                    delivered_qty=qty,
-                    net_unit_price=price,
-                    total_price=total,
-                )
-            )
-            buf = []
-            return True
-
-        i = 0
-        while i < len(lines):
-            ln = lines[i]
-            ln = normalize_ws(ln)
-
-            # Stop heuristics (optional): if invoice totals section starts
-            if re.search(r"\bTOTAL\b|\bTOTALE\b|\bIMPONIBILE\b", ln, re.IGNORECASE) and not _looks_like_item_start(ln):
-                # Do not break too aggressively; but usually items are over here.
-                # We'll only break if we already collected something and buffer is empty.
-                if items and not buf:
-                    break
-
-            # prefix-only line like "SS-" or "VEN-"
-            pm = _RE_PREFIX_ONLY.match(ln)
-            if pm and not buf:
-                pending_prefix = pm.group("prefix")
-                i += 1
+        text = _join_wrapped_prefixes("\n".join(p or "" for p in pdf_text_pages))
+
+        # Single streaming pass: cleaned lines are consumed as they are
+        # produced, so no raw_lines list is materialized. The item table
+        # starts after the first header line; anything collected before it
+        # (normally nothing) is discarded at that point, matching the old
+        # two-phase "find header, then parse" behavior. Documents without a
+        # header parse from the top, as before.
+        asm = _RowAssembler()
+        # Bound methods/globals hoisted to locals: the loop body then runs on
+        # LOAD_FAST instead of a method/global lookup per line.
+        feed = asm.feed
+        is_header = _is_header_line
+        seen_header = False
+        for ln in _iter_clean_lines(text):
+            if not seen_header and is_header(ln.lower()):
+                seen_header = True
+                asm = _RowAssembler()
+                feed = asm.feed
                 continue
+            if not feed(ln):
+                break
+        asm.finish()
 
-            # If we have a pending prefix, attach it to next line's first token
-            if pending_prefix and not buf:
-                first_token, rest = _split_first_token(ln)
-                if first_token:
-                    combined_code = _fix_prefix_code(pending_prefix, first_token)
-                    ln = f"{combined_code} {rest}".strip()
-                pending_prefix = None
-
-            # Start of a new item row?
-            if not buf and _looks_like_item_start(ln):
-                buf = [ln]
-                # If complete immediately, flush
-                if flush_buf_if_complete():
-                    i += 1
-                    continue
-                # else keep accumulating next lines (wrapped description)
-                i += 1
-                continue
-
-            # If we are accumulating, add line and try to flush
-            if buf:
-                # Sometimes there is a stray header repeat line, skip it
-                if _RE_HEADER.search(ln):
-                    i += 1
-                    continue
-
-                buf.append(ln)
-                if flush_buf_if_complete():
-                    i += 1
-                    continue
-
-                # Guard: if buffer becomes too long, reset to avoid runaway
-                if len(buf) > 4:
-                    warnings.append(f"Could not parse row (skipped): {' | '.join(buf)}")
-                    buf = []
-                i += 1
-                continue
-
-            # Otherwise ignore line
-            i += 1
-
-        # Final flush attempt
-        if buf and not flush_buf_if_complete():
-            warnings.append(f"Incomplete row at end (skipped): {' | '.join(buf)}")
+        items = asm.items
+        warnings.extend(asm.warnings)
 
         if not items:
             warnings.append("No line items detected by OmniaParser. (Header not found or format differs.)")
@@ -1,17 +1,29 @@
 from __future__ import annotations
+import sys
 from typing import Dict, Type, List
 from .base import SupplierParser
 
 _REGISTRY: Dict[str, SupplierParser] = {}
 
+# Sorted view of the registry, rebuilt lazily: the registry only changes at
+# bootstrap, while all_parsers() is called per CLI/GUI listing.
+_sorted_cache: List[SupplierParser] | None = None
+
 def register(parser: SupplierParser) -> None:
-    key = parser.supplier_key
+    global _sorted_cache
+    # Interned keys make the registry lookups a pointer compare.
+    key = sys.intern(parser.supplier_key)
     _REGISTRY[key] = parser
+    _sorted_cache = None
 
 def get(key: str) -> SupplierParser:
-    if key not in _REGISTRY:
-        raise KeyError(f"Unknown supplier key: {key}. Available: {list(_REGISTRY.keys())}")
-    return _REGISTRY[key]
+    try:
+        return _REGISTRY[sys.intern(key)]
+    except KeyError:
+        raise KeyError(f"Unknown supplier key: {key}. Available: {list(_REGISTRY.keys())}") from None
 
 def all_parsers() -> List[SupplierParser]:
-    return [p for _, p in sorted(_REGISTRY.items(), key=lambda kv: kv[0])]
+    global _sorted_cache
+    if _sorted_cache is None:
+        _sorted_cache = [p for _, p in sorted(_REGISTRY.items(), key=lambda kv: kv[0])]
+    return list(_sorted_cache)
@@ -1,22 +1,124 @@
 from __future__ import annotations
+import functools
+import os
 import pdfplumber
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any, Optional
 import logging
 
 log = logging.getLogger(__name__)
 
+# Optional: PyMuPDF (fitz) extracts text in C and is typically several times
+# faster than pdfminer-based pdfplumber. It is used automatically when
+# installed; set PDF2XLSX_PDF_BACKEND=pdfplumber to force the fallback.
+try:
+    import fitz  # type: ignore
+except ImportError:
+    fitz = None
+
+def _use_fitz() -> bool:
+    backend = os.environ.get("PDF2XLSX_PDF_BACKEND", "auto").lower()
+    return fitz is not None and backend in ("auto", "fitz", "pymupdf")
+
+def _fitz_has_tables() -> bool:
+    # Table detection landed in PyMuPDF 1.23; older installs fall back to
+    # pdfplumber for tables while keeping fitz for text.
+    return fitz is not None and hasattr(fitz.Page, "find_tables")
+
+# Below this page count a serial pass wins; process spawn plus per-worker
+# re-open only pays off once pdfminer's ~1s/page cost dominates.
+_PARALLEL_PAGE_THRESHOLD = 8
+
+def _extract_text_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    # Worker for the page-range fan-out. Each worker opens its own handle:
+    # pdfplumber pages share one pdfminer parser, so pages of a single open
+    # cannot be extracted concurrently.
+    with pdfplumber.open(pdf_path) as pdf:
+        return [p.extract_text() or "" for p in pdf.pages[start:stop]]
+
 def extract_text_by_page(pdf_path: str) -> List[str]:
     pages: List[str] = []
+    if _use_fitz():
+        with fitz.open(pdf_path) as doc:
+            for i, page in enumerate(doc):
+                txt = page.get_text("text") or ""
+                pages.append(txt)
+                log.debug("Extracted text from page %s (%s chars, fitz)", i + 1, len(txt))
+        return pages
+    with pdfplumber.open(pdf_path) as pdf:
+        n = len(pdf.pages)
+        if n < _PARALLEL_PAGE_THRESHOLD:
+            for i, page in enumerate(pdf.pages):
+                txt = page.extract_text() or ""
+                pages.append(txt)
+                log.debug("Extracted text from page %s (%s chars)", i + 1, len(txt))
+            return pages
+    # Large document: fan page ranges out across processes. pdfminer is pure
+    # Python and GIL-bound, so processes (not threads) buy real concurrency.
+    workers = min(os.cpu_count() or 1, -(-n // _PARALLEL_PAGE_THRESHOLD))
+    chunk = -(-n // workers)
+    ranges = [(i, min(i + chunk, n)) for i in range(0, n, chunk)]
+    log.debug("Extracting %s pages across %s workers", n, len(ranges))
+    with ProcessPoolExecutor(max_workers=len(ranges)) as ex:
+        futures = [ex.submit(_extract_text_range, pdf_path, a, b) for a, b in ranges]
+        for f in futures:
+            pages.extend(f.result())
+    return pages
+
+def extract_pages(pdf_path: str) -> tuple[List[str], List[List[List[str]]]]:
+    """Extract page texts and tables in a single traversal of the PDF.
+
+    pdfplumber re-parses the document per open, so pulling both out of one
+    open halves the parse work compared to calling extract_text_by_page and
+    extract_tables separately.
+    """
+    if _use_fitz():
+        if _fitz_has_tables():
+            texts: List[str] = []
+            tables: List[List[List[str]]] = []
+            with fitz.open(pdf_path) as doc:
+                for page in doc:
+                    texts.append(page.get_text("text") or "")
+                    for t in page.find_tables().tables:
+                        tables.append(t.extract())
+            return texts, tables
+        # Text comes from fitz, tables from pdfplumber; separate opens are
+        # unavoidable across the two backends.
+        return extract_text_by_page(pdf_path), extract_tables(pdf_path)
+    texts: List[str] = []
+    tables: List[List[List[str]]] = []
     with pdfplumber.open(pdf_path) as pdf:
         for i, page in enumerate(pdf.pages):
             txt = page.extract_text() or ""
-            pages.append(txt)
+            texts.append(txt)
             log.debug("Extracted text from page %s (%s chars)", i + 1, len(txt))
-    return pages
+            for t in page.extract_tables() or []:
+                tables.append(t)
+    return texts, tables
+
+@functools.lru_cache(maxsize=8)
+def _extract_pages_cached(pdf_path: str, mtime: float) -> tuple[List[str], List[List[List[str]]]]:
+    return extract_pages(pdf_path)
+
+def extract_pages_cached(pdf_path: str) -> tuple[List[str], List[List[List[str]]]]:
+    """extract_pages with a small per-process cache keyed by path + mtime.
+
+    Converting the same PDF more than once in one process (e.g. against
+    several templates or supplier keys) reuses the parsed pages; editing the
+    file bumps its mtime and misses the cache. Callers must not mutate the
+    returned lists.
+    """
+    return _extract_pages_cached(pdf_path, os.path.getmtime(pdf_path))
 
 def extract_tables(pdf_path: str) -> List[List[List[str]]]:
     # Returns list of tables per page (flattened)
     tables: List[List[List[str]]] = []
+    if _use_fitz() and _fitz_has_tables():
+        with fitz.open(pdf_path) as doc:
+            for page in doc:
+                for t in page.find_tables().tables:
+                    tables.append(t.extract())
+        return tables
     with pdfplumber.open(pdf_path) as pdf:
         for page in pdf.pages:
             for t in page.extract_tables() or []:
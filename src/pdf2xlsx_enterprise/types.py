@@ -2,7 +2,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Optional, Dict, List
 
-@dataclass
+# frozen: requests are read-only once built, and immutability keeps them safe
+# to hand to the convert_many() process pool.
+@dataclass(slots=True, frozen=True)
 class ConvertRequest:
     pdf_path: str
     template_xlsx_path: str
@@ -10,7 +12,7 @@ class ConvertRequest:
     supplier_key: str
     options: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True)
 class LineItem:
     product_number: str = ""
     product_name: str = ""
@@ -20,7 +22,7 @@ class LineItem:
     net_unit_price: str = ""
     total_price: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class ParseResult:
     header: Dict[str, Any]
     items: List[LineItem]
@@ -1,9 +1,18 @@
 from __future__ import annotations
 import re
 
+# Compiled once: normalize_ws runs per line of every PDF page, and the
+# module-level re.sub pays the re cache lookup on each call.
+_WS_RE = re.compile(r"\s+")
+
 def normalize_ws(s: str) -> str:
-    return re.sub(r"\s+", " ", s or "").strip()
+    return _WS_RE.sub(" ", s).strip() if s else ""
+
+# One C-level pass replacing the regex-sub + replace chain: decimal comma to
+# dot, currency sign and (non-breaking) spaces dropped outright — inner
+# whitespace has no meaning in a money token.
+_MONEY_TRANS = str.maketrans({",": ".", " ": "", "\u00a0": "", "€": ""})
 
 def money_to_str(s: str) -> str:
     # Keep as string to avoid locale issues; user can format in Excel.
-    return normalize_ws(s).replace(",", ".")
+    return s.translate(_MONEY_TRANS).strip() if s else ""
@@ -1,10 +1,15 @@
 from __future__ import annotations
-from typing import Dict, Any, List
-from openpyxl import load_workbook
-from openpyxl.worksheet.worksheet import Worksheet
+import operator
+from typing import Dict, Any, List, TYPE_CHECKING
 import logging
 from .types import LineItem
 
+# openpyxl pulls in lxml/styles/charts and costs a few hundred ms; it is
+# imported inside the write functions so runs that never write a workbook
+# (parser-only use, argparse errors, tests) skip it entirely.
+if TYPE_CHECKING:
+    from openpyxl.worksheet.worksheet import Worksheet
+
 log = logging.getLogger(__name__)
 
 DEFAULT_MAPPING = {
@@ -19,13 +24,73 @@ DEFAULT_MAPPING = {
 }
 
 def _find_header_row(ws: Worksheet, required_headers: List[str], scan_rows: int = 50) -> int:
-    for r in range(1, scan_rows + 1):
-        row_vals = [str(c.value).strip() if c.value is not None else "" for c in ws[r]]
-        if all(h in row_vals for h in required_headers):
+    # values_only skips Cell materialization; the subset test hashes each row
+    # once instead of copying and draining the required set per row.
+    required = set(required_headers)
+    for r, row in enumerate(ws.iter_rows(min_row=1, max_row=scan_rows, values_only=True), start=1):
+        row_set = {str(v).strip() for v in row if v is not None}
+        if required.issubset(row_set):
             return r
     return -1
 
+def _field_getter(attrs):
+    # attrgetter returns a bare value for a single name; keep it a tuple.
+    if len(attrs) == 1:
+        return lambda it, _a=attrs[0]: (getattr(it, _a),)
+    return operator.attrgetter(*attrs)
+
+def _write_fast(template_path: str, output_path: str, items: List[LineItem], options: Dict[str, Any]) -> None:
+    # Streaming variant: read_only discovery of the header row, then a
+    # write_only workbook that appends rows without building the full cell
+    # graph. Template styles, formulas and any rows below the header are not
+    # carried over - only for callers that want values.
+    from openpyxl import Workbook, load_workbook
+
+    wb_in = load_workbook(template_path, read_only=True, data_only=True)
+    sheet_name = options.get("sheet_name") or wb_in.sheetnames[0]
+    ws_in = wb_in[sheet_name]
+
+    mapping: Dict[str, str] = options.get("mapping") or DEFAULT_MAPPING
+    headers = list(mapping.keys())
+
+    header_row = _find_header_row(ws_in, headers)
+    if header_row == -1:
+        wb_in.close()
+        raise ValueError(f"Cannot find header row with required headers in sheet '{sheet_name}'. Required: {headers}")
+
+    head_rows: List[List[Any]] = []
+    header_to_col: Dict[str, int] = {}
+    for r, row in enumerate(ws_in.iter_rows(min_row=1, max_row=header_row, values_only=True), start=1):
+        head_rows.append(list(row))
+        if r == header_row:
+            for idx, v in enumerate(row, start=1):
+                val = str(v).strip() if v is not None else ""
+                if val in mapping:
+                    header_to_col[val] = idx
+    wb_in.close()
+
+    wb_out = Workbook(write_only=True)
+    ws_out = wb_out.create_sheet(title=sheet_name)
+    for row in head_rows:
+        ws_out.append(row)
+
+    cols = tuple(header_to_col[h] for h in mapping)
+    getter = _field_getter(tuple(mapping.values()))
+    width = max(cols)
+    for it in items:
+        row = [None] * width
+        for c, v in zip(cols, getter(it)):
+            row[c - 1] = v
+        ws_out.append(row)
+
+    wb_out.save(output_path)
+    log.info("Saved output (fast mode): %s", output_path)
+
 def write_items_to_template(template_path: str, output_path: str, items: List[LineItem], options: Dict[str, Any]) -> None:
+    if options.get("fast_mode"):
+        return _write_fast(template_path, output_path, items, options)
+    from openpyxl import load_workbook
+
     wb = load_workbook(template_path)
     sheet_name = options.get("sheet_name") or wb.sheetnames[0]
     ws = wb[sheet_name]
@@ -49,20 +114,31 @@ def write_items_to_template(template_path: str, output_path: str, items: List[Li
 
     # Optional: clear existing data (until first empty line in first mapped column)
     if options.get("clear_existing", True):
-        max_rows = ws.max_row
         first_col = header_to_col[headers[0]]
-        for r in range(start_row, max_rows + 1):
-            if ws.cell(r, first_col).value in (None, ""):
+        cols_to_clear = set(header_to_col[h] for h in headers)
+        min_col, max_col = min(cols_to_clear), max(cols_to_clear)
+        # iter_rows hands back each row's cells in one pass instead of going
+        # through the .cell() factory for every coordinate.
+        for row_cells in ws.iter_rows(min_row=start_row, min_col=min_col, max_col=max_col):
+            if row_cells[first_col - min_col].value in (None, ""):
                 break
-            for h in headers:
-                ws.cell(r, header_to_col[h]).value = None
+            for cell in row_cells:
+                if cell.column in cols_to_clear:
+                    cell.value = None
 
-    # Write items
+    # Write items. Passing the value positionally to ws.cell() sets it inside
+    # the one call instead of materializing the cell and going through the
+    # .value descriptor a second time. ws.append() would be cheaper still but
+    # only writes at the end of the sheet; template rows start at start_row.
+    # Column indexes and attribute resolution are hoisted out of the loop:
+    # attrgetter pulls all mapped fields per item in one C-level call.
+    cols = tuple(header_to_col[h] for h in mapping)
+    getter = _field_getter(tuple(mapping.values()))
+    cell = ws.cell
     r = start_row
     for it in items:
-        for h, attr in mapping.items():
-            c = header_to_col[h]
-            ws.cell(r, c).value = getattr(it, attr, "")
+        for c, v in zip(cols, getter(it)):
+            cell(r, c, v)
         r += 1
 
     wb.save(output_path)
@@ -0,0 +1,68 @@
+from pdf2xlsx_enterprise.parsers.omnia import OmniaParser
+
+HEADER = "PRODUCT CODE DESCRIPTION QUANTITY PREZZO IMPORTO TOTALE"
+
+
+def _parse(lines):
+    return OmniaParser().parse(["\n".join(lines)], [], {})
+
+
+def test_simple_row():
+    res = _parse([HEADER, "125709 LAMP COVER 100 PZ 1.15€ 115.00€"])
+    assert len(res.items) == 1
+    it = res.items[0]
+    assert it.product_number == "125709"
+    assert it.product_name == "LAMP COVER"
+    assert it.delivered_qty == "100"
+    assert it.net_unit_price == "1.15"
+    assert it.total_price == "115.00"
+
+
+def test_comma_decimal_is_normalized():
+    res = _parse([HEADER, "125709 LAMP COVER 2 PZ 1,15€ 2,30€"])
+    assert res.items[0].net_unit_price == "1.15"
+    assert res.items[0].total_price == "2.30"
+
+
+def test_wrapped_prefix_row():
+    res = _parse([HEADER, "SS-", "2230002839 POIGNEE EQUIPEE C&S MULTI 2 PZ 8.82€ 17.63€"])
+    assert len(res.items) == 1
+    assert res.items[0].product_number == "SS-2230002839"
+
+
+def test_ven_prefix_anomaly():
+    res = _parse([HEADER, "VEN-", "9161.167 D.35.8 SHOWER 1 PZ 1.95€ 1.95€"])
+    assert len(res.items) == 1
+    assert res.items[0].product_number == "VEN-161.167"
+
+
+def test_wrapped_description():
+    res = _parse([HEADER, "AB-123 FIRST PART OF DESC", "SECOND PART 3 PZ 2.00€ 6.00€"])
+    it = res.items[0]
+    assert it.product_number == "AB-123"
+    assert it.product_name == "FIRST PART OF DESC SECOND PART"
+
+
+def test_row_without_description():
+    res = _parse([HEADER, "125709 2 PZ 1.15€ 2.30€"])
+    assert len(res.items) == 1
+    assert res.items[0].product_number == "125709"
+    assert res.items[0].product_name == ""
+    assert res.items[0].delivered_qty == "2"
+
+
+def test_totals_section_stops_parse():
+    res = _parse(
+        [
+            HEADER,
+            "125709 LAMP COVER 1 PZ 1.00€ 1.00€",
+            "Totale documento 1.00€",
+        ]
+    )
+    assert len(res.items) == 1
+
+
+def test_no_items_warns():
+    res = _parse(["just some random text", "nothing like an invoice"])
+    assert res.items == []
+    assert res.warnings